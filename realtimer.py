@@ -4,6 +4,10 @@ import tkinter as tk
 from tkinter import messagebox
 import threading
 import queue
+import time
+import wave
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from openai import OpenAI
 from collections import deque
 import os
@@ -18,9 +22,22 @@ load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
 
+# 실시간(부분) 번역 / 최종 번역 모델 분리
+OPENAI_PARTIAL_MODEL = os.getenv("OPENAI_PARTIAL_MODEL") or OPENAI_MODEL
+OPENAI_PARTIAL_FAST_MODEL = os.getenv("OPENAI_PARTIAL_FAST_MODEL", "gpt-4o-mini")
+OPENAI_FINAL_MODEL = os.getenv("OPENAI_FINAL_MODEL") or OPENAI_MODEL
+OPENAI_FINAL_QUALITY_MODEL = os.getenv("OPENAI_FINAL_QUALITY_MODEL", "")
+
+# 티어별 목표 지연 시간 (ms)
+PARTIAL_LATENCY_TARGET_MS = float(os.getenv("PARTIAL_LATENCY_TARGET_MS", "800"))
+FINAL_LATENCY_TARGET_MS = float(os.getenv("FINAL_LATENCY_TARGET_MS", "2000"))
+
 SPEECH_KEY = os.getenv("SPEECH_KEY")
 SPEECH_REGION = os.getenv("SPEECH_REGION")
 
+# 음성 구간 검출(VAD) 후 음성 구간만 인식기로 전송 (false면 기본 마이크 직접 연결)
+VAD_ENABLED = os.getenv("VAD_ENABLED", "true").lower() == "true"
+
 # ========================
 # 2. 글로벌 변수
 # ========================
@@ -49,6 +66,13 @@ current_translating = ''
 # 마지막 실시간 번역 결과
 last_realtime_translation = ''
 
+# 현재 음성 구간 여부 (VAD)
+is_speaking = False
+
+# 마지막으로 인식 완료된 발화 ID 및 최종 번역 완료 여부 (이전 발화의 늦은 결과 무시용)
+current_utterance_id = 0
+current_utterance_done = True
+
 # ========================
 # 3. 색상 테마 정의
 # ========================
@@ -67,7 +91,483 @@ COLORS = {
 }
 
 # ========================
-# 4. 발표용 STT + 번역 시스템
+# 4. 모델 티어 (지연 시간 기반 모델 선택)
+# ========================
+# 모델별 가격 (USD / 1M 토큰: 입력, 출력) - 목록에 없는 모델은 비용 0으로 집계
+MODEL_PRICING = {
+    'gpt-4o': (2.50, 10.00),
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-4.1': (2.00, 8.00),
+    'gpt-4.1-mini': (0.40, 1.60),
+    'gpt-4.1-nano': (0.10, 0.40),
+}
+
+
+class ModelTier:
+    """번역 경로(실시간/최종)별 모델 선택 및 지연 시간/비용 집계
+
+    models는 빠른 모델 → 고품질 모델 순서의 사다리.
+    측정 지연 시간(EWMA)이 목표를 넘으면 한 단계 빠른 모델로,
+    목표 대비 여유(headroom)가 up_samples 동안 유지되면 한 단계 고품질 모델로 이동한다.
+    빠른 모델로 내려간 뒤에는 cooldown 동안 다시 올라가지 않으며,
+    올라갔다가 곧바로 다시 내려오면 cooldown을 두 배로 늘린다 (최대 max_cooldown_s).
+    """
+
+    def __init__(self, name, models, start_index, target_ms,
+                 headroom=0.5, alpha=0.3, min_samples=3, up_samples=10,
+                 cooldown_s=60.0, max_cooldown_s=900.0):
+        # 빈 값/중복 모델 제거 (순서 유지)
+        ladder = []
+        for model in models:
+            if model and model not in ladder:
+                ladder.append(model)
+        self.name = name
+        self.models = ladder
+        self.index = ladder.index(models[start_index]) if models[start_index] in ladder else 0
+        self.target_ms = target_ms
+        self.headroom = headroom
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self.up_samples = up_samples
+        self.base_cooldown_s = cooldown_s
+        self.cooldown_s = cooldown_s
+        self.max_cooldown_s = max_cooldown_s
+
+        self.lock = threading.Lock()
+        self.up_blocked_until = 0.0
+        self.stepped_up = False
+        self.ewma_ms = None
+        self.samples_since_switch = 0
+        self.stats = {}  # model -> 집계 dict
+
+    @property
+    def model(self):
+        return self.models[self.index]
+
+    def complete(self, prompt, max_tokens):
+        """현재 티어 모델로 번역 요청 후 지연 시간/토큰/비용 기록"""
+        model = self.model
+        start = time.perf_counter()
+        try:
+            resp = client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.0,
+                max_tokens=max_tokens
+            )
+        except Exception:
+            self.record(model, (time.perf_counter() - start) * 1000, error=True)
+            raise
+        latency_ms = (time.perf_counter() - start) * 1000
+        usage = getattr(resp, 'usage', None)
+        self.record(model, latency_ms,
+                    prompt_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
+                    completion_tokens=getattr(usage, 'completion_tokens', 0) or 0)
+        return resp.choices[0].message.content.strip()
+
+    def record(self, model, latency_ms, prompt_tokens=0, completion_tokens=0, error=False):
+        input_price, output_price = MODEL_PRICING.get(model, (0.0, 0.0))
+        cost = (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+        with self.lock:
+            entry = self.stats.setdefault(model, {
+                'calls': 0, 'errors': 0, 'latency_ms': 0.0,
+                'prompt_tokens': 0, 'completion_tokens': 0, 'cost': 0.0
+            })
+            entry['calls'] += 1
+            entry['errors'] += int(error)
+            entry['latency_ms'] += latency_ms
+            entry['prompt_tokens'] += prompt_tokens
+            entry['completion_tokens'] += completion_tokens
+            entry['cost'] += cost
+
+            # 현재 모델의 성공한 요청만 정책에 반영
+            # (전환 직전 요청 결과, 429/연결 오류/타임아웃의 지연 시간은 무시)
+            if model == self.model and not error:
+                if self.ewma_ms is None:
+                    self.ewma_ms = latency_ms
+                else:
+                    self.ewma_ms = self.alpha * latency_ms + (1 - self.alpha) * self.ewma_ms
+                self.samples_since_switch += 1
+                self._adapt()
+
+    def _adapt(self):
+        if self.samples_since_switch < self.min_samples:
+            return
+        now = time.monotonic()
+        new_index = self.index
+        if self.ewma_ms > self.target_ms and self.index > 0:
+            new_index = self.index - 1
+            # 다시 올라가기 전 대기 (연속으로 내려오면 대기 시간 증가)
+            self.up_blocked_until = now + self.cooldown_s
+            self.cooldown_s = min(self.cooldown_s * 2, self.max_cooldown_s)
+        elif (self.ewma_ms < self.target_ms * self.headroom
+              and self.index < len(self.models) - 1
+              and self.samples_since_switch >= self.up_samples
+              and now >= self.up_blocked_until):
+            new_index = self.index + 1
+        elif (self.stepped_up and self.samples_since_switch >= self.up_samples
+              and self.ewma_ms <= self.target_ms):
+            # 올라간 모델이 목표 안에서 안정적이면 cooldown 초기화
+            self.cooldown_s = self.base_cooldown_s
+            self.stepped_up = False
+        if new_index != self.index:
+            self.stepped_up = new_index > self.index
+            print(f"[{self.name}] 모델 전환: {self.model} → {self.models[new_index]} "
+                  f"(평균 {self.ewma_ms:.0f}ms, 목표 {self.target_ms:.0f}ms)")
+            self.index = new_index
+            self.ewma_ms = None
+            self.samples_since_switch = 0
+
+    def summary(self):
+        """티어별 지연 시간/토큰/비용 요약 문자열"""
+        with self.lock:
+            lines = [f"[{self.name}] 현재 모델: {self.model} (목표 {self.target_ms:.0f}ms)"]
+            for model, entry in self.stats.items():
+                avg_ms = entry['latency_ms'] / entry['calls'] if entry['calls'] else 0.0
+                lines.append(
+                    f"  {model}: {entry['calls']}회 (오류 {entry['errors']}), "
+                    f"평균 {avg_ms:.0f}ms, 토큰 {entry['prompt_tokens']}+{entry['completion_tokens']}, "
+                    f"${entry['cost']:.4f}"
+                )
+        return "\n".join(lines)
+
+
+# 실시간 번역: 지연 시간 초과 시 빠른 모델로 전환
+partial_tier = ModelTier("partial",
+                         [OPENAI_PARTIAL_FAST_MODEL, OPENAI_PARTIAL_MODEL],
+                         start_index=1, target_ms=PARTIAL_LATENCY_TARGET_MS)
+# 최종 번역: 여유가 있으면 고품질 모델로 전환
+final_tier = ModelTier("final",
+                       [OPENAI_FINAL_MODEL, OPENAI_FINAL_QUALITY_MODEL],
+                       start_index=0, target_ms=FINAL_LATENCY_TARGET_MS)
+
+
+def print_tier_stats():
+    """티어별 사용량 출력"""
+    print(partial_tier.summary())
+    print(final_tier.summary())
+
+# ========================
+# 5. 절 단위 분할 (긴 문장 병렬 번역)
+# ========================
+# 분할 기준: (전체 단어 수, 최소 청크 단어 수) - 한국어는 어절 기준
+CHUNK_THRESHOLDS = {
+    'ko_to_en': (10, 3),
+    'en_to_ko': (20, 6),
+}
+MAX_CHUNKS = 4
+
+# 한국어 연결 어미 (어절 끝)
+# 한 음절 어미(-고/-며/-면)는 최고/측면/화면 같은 명사와 구분되도록 용언 어간과 함께 나열
+# ('하고'는 조사 "고양이하고", '지고'는 "가지고"와 겹치므로 어미 목록에서 제외)
+KO_CONNECTIVE_ENDINGS = ('면서', '지만', '는데', '은데', '니까', '으니', '어서', '아서', '해서',
+                         '도록', '거나', '든지', '므로', '때문에',
+                         '되고', '있고', '없고', '했고', '됐고', '었고', '았고', '였고', '겠고',
+                         '시고', '하며', '되며', '으며', '이며', '시며',
+                         '하면', '되면', '으면', '다면', '라면', '시면')
+# 단독 어절일 때만 절 경계로 보는 단어 ("운동을 하고")
+KO_CONNECTIVE_WORDS = {'하고'}
+# 연결 어미처럼 보이지만 뒤 서술어와 이어지는 어미 (의도/인용)
+KO_NON_BOUNDARY_ENDINGS = ('려고', '라고', '다고', '자고')
+
+# 영어 종속/대등 접속사 (앞에서 분할) - 관계대명사 which는 쉼표가 있을 때만 분할
+EN_CLAUSE_WORDS = {'but', 'because', 'although', 'though', 'whereas', 'while', 'unless'}
+# 접속사 앞에 붙어 한 덩어리가 되는 단어 (even though, even while)
+# 관사/한정사 뒤의 while은 명사 ("for a while")
+EN_CLAUSE_MODIFIERS = {'even', 'a', 'an', 'the', 'this', 'that', 'these', 'those'}
+
+
+def _is_clause_boundary(words, i, direction):
+    """words[i] 뒤에서 절이 끝나는지 판단"""
+    word = words[i]
+    if word.endswith((',', ';', ':')):
+        return True
+    if direction == 'ko_to_en':
+        stem = word.rstrip('.,;:!?')
+        if stem in KO_CONNECTIVE_WORDS:
+            return True
+        return (len(stem) >= 2 and stem.endswith(KO_CONNECTIVE_ENDINGS)
+                and not stem.endswith(KO_NON_BOUNDARY_ENDINGS))
+    next_word = words[i + 1].lower().strip('.,;:!?') if i + 1 < len(words) else ''
+    after_next = words[i + 2].lower().strip('.,;:!?') if i + 2 < len(words) else ''
+    if next_word == 'but' and after_next == 'also':
+        # not only ... but also
+        return False
+    return next_word in EN_CLAUSE_WORDS and word.lower() not in EN_CLAUSE_MODIFIERS
+
+
+def split_clauses(text, direction):
+    """긴 인식 문장을 절 경계(연결 어미, 쉼표, 접속사)에서 분할
+
+    짧은 문장은 그대로 [text]를 반환한다.
+    """
+    words = text.split()
+    total_words, min_words = CHUNK_THRESHOLDS[direction]
+    if len(words) < total_words:
+        return [text]
+
+    chunks = []
+    current = []
+    for i, word in enumerate(words):
+        current.append(word)
+        remaining = len(words) - i - 1
+        if (len(current) >= min_words and remaining >= min_words
+                and _is_clause_boundary(words, i, direction)):
+            chunks.append(current)
+            current = []
+    if current:
+        chunks.append(current)
+
+    # 청크가 너무 많으면 가장 짧은 인접 쌍부터 병합
+    while len(chunks) > MAX_CHUNKS:
+        i = min(range(len(chunks) - 1), key=lambda k: len(chunks[k]) + len(chunks[k + 1]))
+        chunks[i:i + 2] = [chunks[i] + chunks[i + 1]]
+
+    return [' '.join(chunk) for chunk in chunks]
+
+# ========================
+# 6. 오디오 프론트엔드 (음성 구간 검출)
+# ========================
+# 마이크 오디오를 링 버퍼로 받아 음성 구간(+패딩)만 Azure push stream으로 전송
+AUDIO_SAMPLE_RATE = 16000
+VAD_FRAME_MS = 30
+VAD_MARGIN_DB = 10.0        # 잡음 바닥 대비 음성 판정 여유
+VAD_MIN_DB = -50.0          # 음성으로 판정할 최소 에너지 (dBFS)
+VAD_FLOOR_MIN_DB = -90.0    # 잡음 바닥 하한 (드라이버가 보내는 디지털 무음으로 내려가지 않도록)
+VAD_DIGITAL_SILENCE_DB = -150.0  # 이보다 낮으면 전부 0인 프레임 (잡음 바닥 추적에서 제외)
+VAD_START_MS = 90           # 음성 후보 구간 중 최소 음성 길이
+VAD_CONFIRM_MS = 500        # 음성 시작 확인 구간 (에너지 변화가 있어야 음성으로 판정)
+VAD_STEADY_SPREAD_DB = 6.0  # 에너지 분포(p90 - p10)가 이보다 작으면 일정한 잡음으로 판정
+VAD_HANGOVER_MS = 800       # 음성 종료로 판정할 연속 무음 길이 (Azure 기본 분할 무음 약 500ms보다 길게)
+VAD_PRE_PADDING_MS = 300    # 음성 시작 전 함께 보낼 오디오
+VAD_CALIBRATION_MS = 500    # 잡음 바닥 초기 추정 구간
+VAD_FLOOR_RISE_DB_PER_S = 4.0  # 잡음 바닥 상승 속도 (음성 구간 중에도 적용)
+VAD_END_SILENCE_MS = 500    # 중지(STOP) 시 진행 중인 인식 확정을 위해 보낼 무음
+
+
+def frame_energy_db(samples, frame_len):
+    """int16 샘플을 프레임 단위로 나눠 RMS 에너지(dBFS)를 한 번에 계산"""
+    n_frames = len(samples) // frame_len
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len).astype(np.float32)
+    rms = np.sqrt(np.mean(frames * frames, axis=1)) / 32768.0
+    return 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+
+def energy_spread_db(energies):
+    """에너지 분포 폭 (p90 - p10)과 하위 10% 값"""
+    p10, p90 = np.percentile(energies, [10, 90])
+    return float(p90 - p10), float(p10)
+
+
+class AudioFrontEnd:
+    """에너지 기반 VAD로 음성 구간만 인식기에 전달하는 오디오 프론트엔드
+
+    write: 오디오 바이트를 받는 함수 (예: PushAudioInputStream.write)
+    on_speech_start / on_speech_end: 음성 구간 시작/종료 콜백
+
+    음성은 음절 단위로 에너지가 크게 오르내리고, 팬/공조 소음은 일정하다는 점을 이용한다.
+    - 처음 VAD_CALIBRATION_MS 구간이 일정하면 그 하위 10% 에너지를 잡음 바닥으로 쓰고,
+      변화가 크면(시작부터 말하는 중) VAD_MIN_DB - VAD_MARGIN_DB 이하로 제한한다.
+    - 에너지가 잡음 바닥을 넘으면 VAD_CONFIRM_MS 동안 지켜보고, 에너지 변화가 있을 때만
+      음성 시작으로 판정한다. 일정하게 커진 잡음은 새 잡음 바닥이 된다 (오디오는 링 버퍼에 보관).
+    - 음성 구간 중에도 잡음 바닥을 천천히 따라가고, 최근 구간이 일정하면 잡음 바닥을 다시 추정한다.
+    """
+
+    def __init__(self, write, on_speech_start=None, on_speech_end=None,
+                 sample_rate=AUDIO_SAMPLE_RATE):
+        self.write = write
+        self.on_speech_start = on_speech_start
+        self.on_speech_end = on_speech_end
+        self.sample_rate = sample_rate
+        self.frame_len = sample_rate * VAD_FRAME_MS // 1000
+
+        self.start_frames = max(1, VAD_START_MS // VAD_FRAME_MS)
+        self.confirm_frames = max(1, VAD_CONFIRM_MS // VAD_FRAME_MS)
+        self.pre_padding_frames = VAD_PRE_PADDING_MS // VAD_FRAME_MS
+        self.hangover_frames = max(1, VAD_HANGOVER_MS // VAD_FRAME_MS)
+        self.calibration_frames = max(1, VAD_CALIBRATION_MS // VAD_FRAME_MS)
+        self.floor_rise_db = VAD_FLOOR_RISE_DB_PER_S * VAD_FRAME_MS / 1000
+        self.end_silence = bytes(2 * sample_rate * VAD_END_SILENCE_MS // 1000)
+
+        self.lock = threading.Lock()
+        self.stream = None
+        self.reset()
+
+    def reset(self):
+        """검출 상태 초기화"""
+        with self.lock:
+            # 앞쪽 패딩 + 음성 시작 확인 구간을 보관
+            self.ring = deque(maxlen=self.pre_padding_frames + self.confirm_frames)
+            self.remainder = np.zeros(0, dtype=np.int16)
+            self.calibration = []
+            self.noise_floor_db = None
+            self.candidate = None   # 음성 시작 확인 중인 (에너지, 음성 여부) 목록
+            self.recent = deque(maxlen=self.confirm_frames)
+            self.in_speech = False
+            self.silence_run = 0
+            self.frames_total = 0
+            self.frames_sent = 0
+
+    def process(self, samples):
+        """16-bit 모노 샘플 블록 처리 (길이 제한 없음)"""
+        with self.lock:
+            samples = np.concatenate([self.remainder, np.asarray(samples, dtype=np.int16)])
+            n_frames = len(samples) // self.frame_len
+            self.remainder = samples[n_frames * self.frame_len:]
+            if n_frames == 0:
+                return
+
+            energies = frame_energy_db(samples, self.frame_len)
+            for i, db in enumerate(energies):
+                frame = samples[i * self.frame_len:(i + 1) * self.frame_len].tobytes()
+                if self.noise_floor_db is None:
+                    self._calibrate(frame, float(db))
+                else:
+                    self._process_frame(frame, float(db))
+
+    def _calibrate(self, frame, db):
+        # 초기 구간을 모아 잡음 바닥을 정한 뒤, 모은 프레임을 다시 검출에 통과시킴
+        if db <= VAD_DIGITAL_SILENCE_DB:
+            # 스트림 시작 직후의 디지털 무음은 잡음 추정에 쓰지 않고 버림
+            self.frames_total += 1
+            return
+        self.calibration.append((frame, db))
+        if len(self.calibration) < self.calibration_frames:
+            return
+        spread, p10 = energy_spread_db([e for _, e in self.calibration])
+        if spread >= VAD_STEADY_SPREAD_DB:
+            # 변화가 큼 = 이미 말하는 중일 수 있음: 음성이 잡음 바닥이 되지 않도록 제한
+            p10 = min(p10, VAD_MIN_DB - VAD_MARGIN_DB)
+        self.noise_floor_db = max(p10, VAD_FLOOR_MIN_DB)
+        calibration, self.calibration = self.calibration, []
+        for buffered, buffered_db in calibration:
+            self._process_frame(buffered, buffered_db)
+
+    def _process_frame(self, frame, db):
+        self.frames_total += 1
+        digital_silence = db <= VAD_DIGITAL_SILENCE_DB
+        is_speech = not digital_silence and db > max(self.noise_floor_db + VAD_MARGIN_DB, VAD_MIN_DB)
+
+        # 잡음 바닥 추적 (낮아질 때는 즉시, 높아질 때는 천천히)
+        # 음성 구간 중에도 계속 따라가야 배경 잡음이 커졌을 때 게이트가 열린 채로 남지 않음
+        if not digital_silence:
+            if db < self.noise_floor_db:
+                self.noise_floor_db = max(db, VAD_FLOOR_MIN_DB)
+            else:
+                self.noise_floor_db += min(db - self.noise_floor_db, self.floor_rise_db)
+
+        if not self.in_speech:
+            self.ring.append(frame)
+            if self.candidate is None:
+                if is_speech:
+                    self.candidate = [(db, is_speech)]
+                return
+            self.candidate.append((db, is_speech))
+            if len(self.candidate) >= self.confirm_frames:
+                self._confirm_candidate()
+            return
+
+        # 음성 구간: 무음이 hangover 동안 이어질 때까지 계속 전송 (뒤쪽 패딩)
+        # hangover가 Azure 분할 무음보다 길어서 실제 무음만으로 인식이 확정됨
+        self._send(frame)
+        if not digital_silence:
+            self.recent.append(db)
+            if len(self.recent) == self.recent.maxlen:
+                spread, p10 = energy_spread_db(self.recent)
+                if spread < VAD_STEADY_SPREAD_DB:
+                    # 최근 구간이 일정함 = 커진 배경 잡음: 잡음 바닥 재추정
+                    self.noise_floor_db = max(self.noise_floor_db, p10)
+                    self.recent.clear()
+        self.silence_run = 0 if is_speech else self.silence_run + 1
+        if self.silence_run >= self.hangover_frames:
+            self.in_speech = False
+            self.recent.clear()
+            if self.on_speech_end:
+                self.on_speech_end()
+
+    def _confirm_candidate(self):
+        """음성 시작 확인 구간 판정"""
+        candidate, self.candidate = self.candidate, None
+        if sum(flag for _, flag in candidate) < self.start_frames:
+            # 짧은 잡음
+            return
+        spread, p10 = energy_spread_db([e for e, _ in candidate])
+        if spread < VAD_STEADY_SPREAD_DB:
+            # 일정하게 커진 잡음: 새 잡음 바닥으로 사용
+            self.noise_floor_db = max(self.noise_floor_db, p10)
+            return
+
+        # 음성 시작: 링 버퍼(앞쪽 패딩 + 확인 구간)부터 전송
+        self.in_speech = True
+        self.silence_run = 0
+        for buffered in self.ring:
+            self._send(buffered)
+        self.ring.clear()
+        if self.on_speech_start:
+            self.on_speech_start()
+
+    def flush(self):
+        """중지 시 진행 중인 음성 구간을 닫고 무음을 보내 마지막 인식을 확정"""
+        with self.lock:
+            if not self.in_speech:
+                return
+            self.in_speech = False
+            self.recent.clear()
+            self.write(self.end_silence)
+        if self.on_speech_end:
+            self.on_speech_end()
+
+    def _send(self, frame):
+        self.frames_sent += 1
+        self.write(frame)
+
+    def feed_wav(self, path, block_ms=100, realtime=False):
+        """WAV 파일을 마이크 입력처럼 흘려보냄 (16-bit, 동일 샘플레이트)"""
+        with wave.open(path, 'rb') as wav:
+            if wav.getsampwidth() != 2 or wav.getframerate() != self.sample_rate:
+                raise ValueError(f"{self.sample_rate}Hz 16-bit WAV만 지원합니다: {path}")
+            channels = wav.getnchannels()
+            block = self.sample_rate * block_ms // 1000
+            while True:
+                data = wav.readframes(block)
+                if not data:
+                    break
+                samples = np.frombuffer(data, dtype=np.int16)
+                if channels > 1:
+                    samples = samples.reshape(-1, channels).mean(axis=1).astype(np.int16)
+                self.process(samples)
+                if realtime:
+                    time.sleep(block_ms / 1000)
+
+    def start_microphone(self):
+        """기본 마이크 캡처 시작"""
+        # PortAudio가 없는 환경(WAV 테스트 등)에서도 모듈을 불러올 수 있도록 지연 import
+        import sounddevice as sd
+
+        def callback(indata, frames, time_info, status):
+            self.process(indata[:, 0].copy())
+
+        self.stream = sd.InputStream(samplerate=self.sample_rate, channels=1, dtype='int16',
+                                     blocksize=self.frame_len, callback=callback)
+        self.stream.start()
+
+    def stop_microphone(self):
+        """마이크 캡처 중지"""
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+    def summary(self):
+        """전송량 요약 문자열"""
+        with self.lock:
+            ratio = self.frames_sent / self.frames_total * 100 if self.frames_total else 0.0
+            return (f"[audio] 전송 {self.frames_sent * VAD_FRAME_MS / 1000:.1f}s / "
+                    f"입력 {self.frames_total * VAD_FRAME_MS / 1000:.1f}s ({ratio:.0f}%)")
+
+# ========================
+# 7. 발표용 STT + 번역 시스템
 # ========================
 class PresentationSTT:
     def __init__(self):
@@ -78,6 +578,12 @@ class PresentationSTT:
         self.font_size = tk.IntVar(value=16)
         self.direction = tk.StringVar(value='ko_to_en')
         self.realtime_mode = tk.BooleanVar(value=True)
+
+        # 음성 구간 검출 사용 여부 (오디오 캡처 실패 시 기본 마이크로 전환)
+        self.vad_available = VAD_ENABLED
+
+        # STOP 이후 마지막 인식 결과를 받는 중 (session_stopped 전까지)
+        self.finalizing = False
         
         # 창 속성 개선
         self.root.configure(bg=COLORS['bg_primary'])
@@ -283,7 +789,7 @@ class PresentationSTT:
         if is_listening:
             current_color = self.status_label.cget("fg")
             new_color = COLORS['success'] if current_color == COLORS['error'] else COLORS['error']
-            self.status_label.config(fg=new_color, text="LIVE")
+            self.status_label.config(fg=new_color, text="LIVE · SPEECH" if is_speaking else "LIVE")
         else:
             self.status_label.config(fg=COLORS['text_muted'], text="READY")
         
@@ -322,12 +828,32 @@ class PresentationSTT:
         else:  # en_to_ko
             speech_config.speech_recognition_language = "en-US"
 
-        audio_config = speechsdk.audio.AudioConfig(use_default_microphone=True)
+        # 이전 오디오 프론트엔드 정리
+        if getattr(self, 'audio_front_end', None):
+            self.audio_front_end.stop_microphone()
+            self.push_stream.close()
+        self.audio_front_end = None
+
+        if self.vad_available:
+            stream_format = speechsdk.audio.AudioStreamFormat(
+                samples_per_second=AUDIO_SAMPLE_RATE, bits_per_sample=16, channels=1
+            )
+            self.push_stream = speechsdk.audio.PushAudioInputStream(stream_format=stream_format)
+            audio_config = speechsdk.audio.AudioConfig(stream=self.push_stream)
+            self.audio_front_end = AudioFrontEnd(
+                self.push_stream.write,
+                on_speech_start=lambda: subtitle_queue.put(("speech_start", None)),
+                on_speech_end=lambda: subtitle_queue.put(("speech_end", None))
+            )
+        else:
+            audio_config = speechsdk.audio.AudioConfig(use_default_microphone=True)
         self.speech_recognizer = speechsdk.SpeechRecognizer(
             speech_config=speech_config, audio_config=audio_config
         )
         self.speech_recognizer.recognized.connect(self.on_recognized)
         self.speech_recognizer.recognizing.connect(self.on_recognizing)
+        self.speech_recognizer.session_stopped.connect(self.on_session_stopped)
+        self.speech_recognizer.canceled.connect(self.on_session_stopped)
 
     def change_direction(self):
         """번역 방향 변경"""
@@ -381,14 +907,7 @@ class PresentationSTT:
             else:
                 prompt = f"Translate English veterinary text to Korean with context consistency. Output only Korean translation:{context_text}\n{source_text}"
 
-            resp = client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.0,
-                max_tokens=80  # 더 짧게
-            )
-
-            translated = resp.choices[0].message.content.strip()
+            translated = partial_tier.complete(prompt, max_tokens=80)  # 더 짧게
             # 실시간 번역 결과를 큐에 추가
             subtitle_queue.put(("realtime_translation", translated))
 
@@ -403,14 +922,33 @@ class PresentationSTT:
             subtitle_queue.put(("recognizing", evt.result.text))
 
     def on_recognized(self, evt):
-        if evt.result.text and is_listening:
+        # STOP 직후 flush()로 확정된 마지막 문장도 받음
+        if evt.result.text and (is_listening or self.finalizing):
             global current_recognizing
             current_recognizing = ''
             subtitle_queue.put(("recognized", evt.result.text))
 
+    def on_session_stopped(self, evt):
+        self.finalizing = False
+
     def start_listening(self):
         global is_listening
         if not is_listening:
+            if self.audio_front_end:
+                try:
+                    self.audio_front_end.reset()
+                    self.audio_front_end.start_microphone()
+                except Exception as e:
+                    # 오디오 캡처(PortAudio/입력 장치) 실패 시 기본 마이크 직접 연결로 전환
+                    print(f"오디오 캡처 시작 실패, 기본 마이크로 전환: {e}")
+                    self.vad_available = False
+                    try:
+                        self.update_speech_config()
+                    except Exception as err:
+                        messagebox.showerror("오류", f"음성 인식 초기화 실패: {str(err)}")
+                        return
+                    messagebox.showwarning("경고", f"음성 구간 검출을 사용할 수 없어 기본 마이크로 전환합니다.\n{str(e)}")
+
             is_listening = True
             self.start_btn.config(state="disabled", bg=COLORS['text_muted'])
             self.stop_btn.config(state="normal", bg=COLORS['error'])
@@ -418,18 +956,28 @@ class PresentationSTT:
             print("음성 인식 시작")
 
     def stop_listening(self):
-        global is_listening
+        global is_listening, is_speaking
         if is_listening:
             is_listening = False
+            is_speaking = False
             self.start_btn.config(state="normal", bg=COLORS['success'])
             self.stop_btn.config(state="disabled", bg=COLORS['text_muted'])
+            if self.audio_front_end:
+                self.audio_front_end.stop_microphone()
+                self.finalizing = True
+                self.audio_front_end.flush()
             self.speech_recognizer.stop_continuous_recognition_async()
             print("음성 인식 중지")
+            print_tier_stats()
+            if self.audio_front_end:
+                print(self.audio_front_end.summary())
 
     def quit_app(self):
         global is_listening
         is_listening = False
         try:
+            if self.audio_front_end:
+                self.audio_front_end.stop_microphone()
             self.speech_recognizer.stop_continuous_recognition_async()
         except:
             pass
@@ -437,7 +985,7 @@ class PresentationSTT:
         self.root.destroy()
 
     def check_queue(self):
-        global last_realtime_translation
+        global last_realtime_translation, is_speaking, current_utterance_id, current_utterance_done
         try:
             while True:
                 msg_type, korean_text = subtitle_queue.get_nowait()
@@ -454,10 +1002,30 @@ class PresentationSTT:
                 elif msg_type == "recognized":
                     # 인식 완료 후 최종 번역 시작
                     last_realtime_translation = ''  # 실시간 번역 초기화
+                    current_utterance_id += 1
+                    current_utterance_done = False
                     self.update_subtitles(is_translating=True)
                     threading.Thread(
-                        target=self.translate_and_add, args=(korean_text,), daemon=True
+                        target=self.translate_and_add,
+                        args=(korean_text, current_utterance_id), daemon=True
                     ).start()
+                elif msg_type == "speech_start":
+                    # VAD 음성 구간 시작
+                    is_speaking = True
+                elif msg_type == "speech_end":
+                    # VAD 음성 구간 종료 (인식 확정 대기)
+                    is_speaking = False
+                elif msg_type == "chunk_translation":
+                    # 분할 번역 중간 결과 (완료된 청크부터 표시, 이전 발화 결과는 무시)
+                    utterance_id, progress = korean_text
+                    if utterance_id == current_utterance_id:
+                        self.update_subtitles(chunk_translation=progress)
+                elif msg_type == "translated":
+                    # 최종 번역 완료 (히스토리 반영)
+                    if korean_text == current_utterance_id:
+                        current_utterance_done = True
+                    # 더 최근 발화가 번역 중이면 진행 표시 유지
+                    self.update_subtitles(is_translating=not current_utterance_done)
                 elif msg_type == "realtime_translation":
                     # 실시간 번역 결과 업데이트 (다른 번역과 다를 때만)
                     if korean_text != last_realtime_translation:
@@ -467,17 +1035,44 @@ class PresentationSTT:
             pass
         self.root.after(50, self.check_queue)
 
-    def translate_and_add(self, source_text):
+    def translate_and_add(self, source_text, utterance_id):
+        chunks = split_clauses(source_text, translation_direction)
+        if len(chunks) > 1:
+            self.translate_chunks_and_add(source_text, chunks, utterance_id)
+            return
+
         try:
             translated_text = self.translate_with_openai(source_text)
             history.append((source_text, translated_text))
-            self.update_subtitles()
         except Exception as e:
             print(f"번역 오류: {e}")
             history.append((source_text, "Translation Error"))
-            self.update_subtitles()
-
-    def update_subtitles(self, temp_text=None, is_translating=False, realtime_translation=None):
+        subtitle_queue.put(("translated", utterance_id))
+
+    def translate_chunks_and_add(self, source_text, chunks, utterance_id):
+        """긴 문장을 절 단위로 병렬 번역하고 순서대로 이어 붙임"""
+        results = [None] * len(chunks)
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = {
+                executor.submit(self.translate_with_openai, chunk, source_text): i
+                for i, chunk in enumerate(chunks)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    print(f"번역 오류 (청크 {i + 1}/{len(chunks)}): {e}")
+                    results[i] = "Translation Error"
+                # 완료된 청크까지 표시 (미완료 청크는 … 로 표시)
+                progress = ' '.join(r if r is not None else '…' for r in results)
+                subtitle_queue.put(("chunk_translation", (utterance_id, progress)))
+
+        history.append((source_text, ' '.join(results)))
+        subtitle_queue.put(("translated", utterance_id))
+
+    def update_subtitles(self, temp_text=None, is_translating=False, realtime_translation=None,
+                         chunk_translation=None):
         """자막 업데이트 (블록 스타일 번역문 표시)"""
         global current_processing_index
 
@@ -495,11 +1090,14 @@ class PresentationSTT:
             self.subtitle_text.insert("end", "\n")
 
         # 실시간 번역 및 인식 상태 표시
-        if temp_text or is_translating or realtime_translation:
+        if temp_text or is_translating or realtime_translation or chunk_translation:
             if history:
                 self.subtitle_text.insert("end", "\n")
 
-            if realtime_translation and self.realtime_mode.get():
+            if chunk_translation:
+                # 분할 번역 진행 중인 결과 표시
+                self.subtitle_text.insert("end", f" {chunk_translation} ", "translating")
+            elif realtime_translation and self.realtime_mode.get():
                 # 실시간 번역 결과만 표시 (한국어 제거)
                 self.subtitle_text.insert("end", f" {realtime_translation} ", "translating")
             elif is_translating:
@@ -514,7 +1112,7 @@ class PresentationSTT:
         self.subtitle_text.see("end")
         self.subtitle_text.config(state="disabled")
 
-    def translate_with_openai(self, source_text):
+    def translate_with_openai(self, source_text, full_text=None):
         global translation_direction
 
         # 이전 대화 맥락 구성 (최근 3개 문장)
@@ -529,6 +1127,12 @@ class PresentationSTT:
                 else:
                     context_text += f"{i}. English: {source}\n   Korean: {translated}\n"
 
+        # 절 단위 분할 번역: 전체 문장을 공통 맥락으로 제공
+        if full_text:
+            context_text += (f"\nFull sentence (context only):\n{full_text}\n"
+                             "Translate ONLY the current part below. It will be joined with the "
+                             "translations of the other parts, so output just this fragment.\n")
+
         if translation_direction == 'ko_to_en':
             prompt = f"""Translate this Korean veterinary presentation text to natural, professional English. Use proper veterinary terminology and maintain consistency with the conversation context. Output ONLY the English translation, no explanations or additional text:{context_text}
 
@@ -541,17 +1145,11 @@ Current text to translate:
 {source_text}"""
 
 
-        resp = client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.0,
-            max_tokens=200
-        )
-        return resp.choices[0].message.content.strip()
+        return final_tier.complete(prompt, max_tokens=200)
 
 
 # ========================
-# 5. API 연결 확인
+# 8. API 연결 확인
 # ========================
 def check_api_connections():
     """API key 연결 상태 확인"""
@@ -603,7 +1201,7 @@ def check_api_connections():
 
 
 # ========================
-# 6. 메인 실행
+# 9. 메인 실행
 # ========================
 def main():
     print("실시간 발표 통역 시스템 시작")
@@ -619,6 +1217,7 @@ def main():
 
     app = PresentationSTT()
     app.root.mainloop()
+    print_tier_stats()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+from realtimer import split_clauses
+
+# 긴 문장 절 단위 분할 테스트
+# 명사구/관용구 안에서 잘리지 않고 절 경계에서만 나뉘는지 확인합니다.
+
+CASES = [
+    # (이름, 방향, 입력, 예상 분할 결과)
+    ("명사 + 조사 '하고'", 'ko_to_en',
+     "오늘은 고양이하고 강아지하고 토끼에서 자주 보이는 피부 질환의 진단과 치료 방법을 말씀드리겠습니다",
+     ["오늘은 고양이하고 강아지하고 토끼에서 자주 보이는 피부 질환의 진단과 치료 방법을 말씀드리겠습니다"]),
+    ("'가지고'", 'ko_to_en',
+     "이 약물을 가지고 치료를 시작하면 대부분의 환자에서 증상이 빠르게 호전되고 부작용도 거의 없었습니다",
+     ["이 약물을 가지고 치료를 시작하면",
+      "대부분의 환자에서 증상이 빠르게 호전되고",
+      "부작용도 거의 없었습니다"]),
+    ("'측면/화면/최고' 명사", 'ko_to_en',
+     "이 화면 보시면 최고 수준의 치료 결과를 확인할 수 있는 측면 사진과 표면 사진이 있습니다 정말",
+     ["이 화면 보시면",
+      "최고 수준의 치료 결과를 확인할 수 있는 측면 사진과 표면 사진이 있습니다 정말"]),
+    ("연결 어미 + 쉼표", 'ko_to_en',
+     "오늘은 고양이의 만성 신장 질환에 대해 말씀드리려고 하는데 특히 초기 진단이 어렵기 때문에 "
+     "혈액 검사와 소변 검사를 함께 진행해야 하며, 최근에는 SDMA 수치를 활용하는 경우가 많습니다.",
+     ["오늘은 고양이의 만성 신장 질환에 대해 말씀드리려고 하는데",
+      "특히 초기 진단이 어렵기 때문에",
+      "혈액 검사와 소변 검사를 함께 진행해야 하며,",
+      "최근에는 SDMA 수치를 활용하는 경우가 많습니다."]),
+    ("짧은 문장", 'ko_to_en',
+     "안녕하세요 오늘 발표를 시작하겠습니다",
+     ["안녕하세요 오늘 발표를 시작하겠습니다"]),
+    ("'for a while'", 'en_to_ko',
+     "The dog was kept under observation in the clinic for a while because the owner "
+     "had not noticed the early signs of heart disease at home",
+     ["The dog was kept under observation in the clinic for a while",
+      "because the owner had not noticed the early signs of heart disease at home"]),
+    ("'not only ... but also'", 'en_to_ko',
+     "Not only does this protocol reduce pain and swelling in chronic inflammation "
+     "but also it improves mobility in older patients",
+     ["Not only does this protocol reduce pain and swelling in chronic inflammation "
+      "but also it improves mobility in older patients"]),
+    ("'even though'", 'en_to_ko',
+     "The patient recovered well after surgery last year even though the owner "
+     "missed several follow-up appointments during the winter months",
+     ["The patient recovered well after surgery last year even though the owner "
+      "missed several follow-up appointments during the winter months"]),
+    ("쉼표 없는 'which'", 'en_to_ko',
+     "We treated the dog with a new anti-inflammatory drug which we developed in our lab "
+     "because the standard therapy failed completely",
+     ["We treated the dog with a new anti-inflammatory drug which we developed in our lab",
+      "because the standard therapy failed completely"]),
+    ("쉼표 + 'which'/'but'", 'en_to_ko',
+     "Today I want to talk about chronic kidney disease in cats, which is one of the most common "
+     "conditions we see in older patients, but early diagnosis remains difficult in practice",
+     ["Today I want to talk about chronic kidney disease in cats,",
+      "which is one of the most common conditions we see in older patients,",
+      "but early diagnosis remains difficult in practice"]),
+]
+
+print("=" * 60)
+print("절 단위 분할 테스트 시작")
+print("=" * 60)
+
+passed = 0
+for name, direction, text, expected in CASES:
+    result = split_clauses(text, direction)
+    if result == expected:
+        passed += 1
+        print(f"[OK] {name}")
+    else:
+        print(f"[FAIL] {name}")
+        print(f"    예상: {expected}")
+        print(f"    결과: {result}")
+
+print("\n" + "=" * 60)
+print(f"테스트 완료: {passed}/{len(CASES)} 통과")
+print("=" * 60)
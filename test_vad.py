@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+import wave
+import numpy as np
+from realtimer import AudioFrontEnd, AUDIO_SAMPLE_RATE, VAD_HANGOVER_MS, VAD_PRE_PADDING_MS
+
+# 음성 구간 검출(VAD) 오디오 프론트엔드 테스트
+# 합성 WAV 파일을 가짜 인식기에 흘려보내 음성 시작/종료 이벤트와 전송량을 확인합니다.
+
+rng = np.random.default_rng(0)
+
+
+def noise(seconds, level=30):
+    """배경 잡음 (level=30 약 -61dBFS, level=260 약 -42dBFS)"""
+    return rng.normal(0, level, int(AUDIO_SAMPLE_RATE * seconds))
+
+
+def zeros(seconds):
+    """드라이버가 스트림 시작 직후 보내는 디지털 무음"""
+    return np.zeros(int(AUDIO_SAMPLE_RATE * seconds))
+
+
+def speech(seconds, noise_level=30):
+    """음성 대신 사용하는 220Hz 톤 (초당 4음절 진폭 변조 + 배경 잡음)"""
+    t = np.arange(int(AUDIO_SAMPLE_RATE * seconds)) / AUDIO_SAMPLE_RATE
+    envelope = 0.5 * (1 - np.cos(2 * np.pi * 4 * t))
+    return 8000 * envelope * np.sin(2 * np.pi * 220 * t) + noise(seconds, noise_level)
+
+
+def write_wav(path, parts):
+    samples = np.clip(np.concatenate(parts), -32768, 32767).astype(np.int16)
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(AUDIO_SAMPLE_RATE)
+        wav.writeframes(samples.tobytes())
+    return len(samples) / AUDIO_SAMPLE_RATE
+
+
+class FakeRecognizer:
+    """push stream 대신 전송된 오디오와 이벤트를 기록"""
+
+    def __init__(self):
+        self.bytes_written = 0
+        self.events = []
+
+    def write(self, data):
+        self.bytes_written += len(data)
+
+    def speech_start(self):
+        self.events.append("start")
+
+    def speech_end(self):
+        self.events.append("end")
+
+    @property
+    def seconds_written(self):
+        return self.bytes_written / 2 / AUDIO_SAMPLE_RATE
+
+
+def run_case(name, parts, expected_segments, speech_seconds, max_sent_seconds=None):
+    """WAV를 만들어 흘려보내고 결과 확인"""
+    path = os.path.join(tempfile.gettempdir(), f"test_vad_{name}.wav")
+    total = write_wav(path, parts)
+
+    recognizer = FakeRecognizer()
+    front_end = AudioFrontEnd(recognizer.write, recognizer.speech_start, recognizer.speech_end)
+    front_end.feed_wav(path)
+    os.remove(path)
+
+    if max_sent_seconds is None:
+        padding = (VAD_PRE_PADDING_MS + VAD_HANGOVER_MS) / 1000
+        max_sent_seconds = speech_seconds + expected_segments * padding + 0.1
+
+    ok = (recognizer.events == ["start", "end"] * expected_segments
+          and speech_seconds <= recognizer.seconds_written <= max_sent_seconds)
+    print(f"[{'OK' if ok else 'FAIL'}] {name}")
+    print(f"    이벤트: {recognizer.events} (예상 구간 {expected_segments}개)")
+    print(f"    전송: {recognizer.seconds_written:.2f}s / 입력 {total:.2f}s "
+          f"(허용 범위 {speech_seconds:.2f}~{max_sent_seconds:.2f}s)")
+    return ok
+
+
+print("=" * 60)
+print("VAD 오디오 프론트엔드 테스트 시작")
+print("=" * 60)
+
+results = [
+    # 1. 잡음 사이의 두 발화
+    run_case("two_utterances",
+             [noise(2), speech(1.5), noise(3), speech(0.8), noise(2)],
+             expected_segments=2, speech_seconds=2.3),
+    # 2. START 직후부터 말하고 있는 경우 (첫 발화가 잡음 바닥으로 잡히면 안 됨)
+    run_case("speech_at_start",
+             [speech(1.0), noise(3), speech(1.0), noise(2)],
+             expected_segments=2, speech_seconds=2.0),
+    # 3. 시끄러운 방의 일정한 잡음만 있는 경우 (음성 구간이 생기면 안 됨)
+    run_case("steady_room_noise",
+             [noise(10, level=260)],
+             expected_segments=0, speech_seconds=0.0, max_sent_seconds=0.0),
+    # 4. 스트림 시작 직후 디지털 무음 뒤 잡음 (잡음 바닥이 -200dB로 떨어지면 안 됨)
+    run_case("zeros_then_room_noise",
+             [zeros(0.1), noise(20, level=260)],
+             expected_segments=0, speech_seconds=0.0, max_sent_seconds=0.0),
+    # 5. 배경 잡음이 갑자기 10배 커지는 경우 (게이트가 열리면 안 됨)
+    run_case("noise_step_up",
+             [noise(2), noise(5, level=300)],
+             expected_segments=0, speech_seconds=0.0, max_sent_seconds=0.0),
+    # 6. 말하는 도중 배경 잡음이 커지는 경우 (게이트가 열린 채로 남으면 안 됨)
+    run_case("noise_step_during_speech",
+             [noise(2), speech(1.5), noise(5, level=300)],
+             expected_segments=1, speech_seconds=1.5, max_sent_seconds=4.0),
+]
+
+print("\n" + "=" * 60)
+print(f"테스트 완료: {sum(results)}/{len(results)} 통과")
+print("=" * 60)